@@ -2,27 +2,75 @@ from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 import time
 
-def setup_chrome_driver():
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Hide the most common automation fingerprints
+NAVIGATOR_PATCH_JS = """
+    Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+    Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
+    Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3]});
+"""
+
+# Resources the scraper never reads: images, web fonts and ad/analytics hosts.
+# Stylesheets are kept because tab rendering depends on them.
+BLOCKED_URLS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf",
+    "*doubleclick*", "*googletagmanager*", "*google-analytics*",
+    "*googlesyndication*", "*facebook*",
+]
+
+def setup_chrome_driver(page_load_strategy="eager"):
+    """
+    Create a headless Chrome driver.
+
+    page_load_strategy:
+    - "eager": driver.get() returns at DOMContentLoaded instead of waiting
+      for images, fonts and trackers (callers wait for elements explicitly)
+    - "normal": wait for the full page load
+    - "none": return immediately after navigation starts
+    """
 
     chrome_options = Options()
+    chrome_options.page_load_strategy = page_load_strategy
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--headless=new")
     chrome_options.add_argument("--disable-blink-features=AutomationControlled")
     chrome_options.add_argument("--disable-infobars")
     chrome_options.add_argument("--disable-extensions")
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+    # Performance: skip GPU, images, background work and unused features
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-background-timer-throttling")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+    chrome_options.add_argument("--disable-features=TranslateUI,MediaRouter,OptimizationHints")
+    chrome_options.add_argument("--disable-webgl")
+    chrome_options.add_argument("--autoplay-policy=user-gesture-required")
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.add_argument("--no-first-run")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
 
     try:
         driver = webdriver.Chrome(options=chrome_options)
         driver.set_window_size(1920, 1080)
 
-        # Fake navigator
-        driver.execute_script("""
-            Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-            Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
-            Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3]});
-        """)
+        # Block heavy and third-party resources at the network layer
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+
+        # Fake navigator on every document the driver loads from now on
+        driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument",
+            {"source": NAVIGATOR_PATCH_JS}
+        )
         return driver
     except Exception as e:
         raise RuntimeError(f"Failed to initialize ChromeDriver: {e}")
@@ -12,13 +12,13 @@ Responsibilities:
 - Load KBB vehicle pages
 - Navigate style categories (tabs)
 - Extract style-level specifications and pricing data
-- Return results as structured pandas DataFrames
+- Stream results as structured pandas DataFrames into the raw CSV
 
 Non-Responsibilities:
 --------------------
 - Business logic
 - Data validation or cleaning
-- Persistence (database / files)
+- Persistence beyond the raw CSV (database / processed files)
 - Analytics or machine learning
 
 Design Principle:
@@ -28,14 +28,34 @@ Single Responsibility — this module is strictly for data crawling.
 
 # Custom Chrome driver setup (configured elsewhere with options, anti-bot, etc.)
 from app.core.driver import setup_chrome_driver as scd
+from app.core.driver import USER_AGENT
 
 # Selenium utilities for locating elements and waiting
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+
+# Browser-free fast path for server-rendered pages
+from selectolax.lexbor import LexborHTMLParser
+import httpx
+
+# Bookkeeping of model-year pages known not to exist
+import json
+import os
+
+# Memory of the Chrome processes behind each pooled driver
+import psutil
+
+# Concurrency: worker threads share a pool of drivers and an HTTP client
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import threading
+import queue
 
 # Data processing
+import lxml.html
+import numpy as np
 import pandas as pd
 import time
 
@@ -151,6 +171,26 @@ CARS = {
 }
 
 YEARS = [2015, 2020]
+
+# Browser pool settings
+POOL_SIZE = 4                 # number of Chrome instances scraping in parallel
+MAX_USES_PER_INSTANCE = 50    # pages a driver serves before it is recycled
+MAX_RSS_MB_PER_INSTANCE = 1500  # recycle earlier if its Chrome processes grow past this
+WAIT_TIMEOUT = 15             # seconds to wait for page elements
+POLL_FREQUENCY = 0.1          # seconds between wait checks (Selenium default is 0.5)
+HTTP_MAX_CONNECTIONS = 20     # concurrent plain HTTP fetches (= worker threads)
+HTTP_TIMEOUT = 5              # seconds; the HTTP path must stay cheaper than Chrome
+MAX_PAGES_IN_FLIGHT = 40      # pages submitted but not yet written to the CSV
+
+# Column dtype for scraped text
+STRING_DTYPE = "string[pyarrow]"
+
+# Raw output, written page by page while scraping
+CSV_PATH = "data/raw/car_data.csv"
+
+# URLs that returned 404 or never showed a Styles section; skipped on later runs.
+# Delete the file to retry them.
+KNOWN_MISSING_PATH = "data/known_missing.json"
 #To do list
 # Edit text so it is more stable -done
 # Add more cars
@@ -159,65 +199,214 @@ YEARS = [2015, 2020]
 
 
 
+# Locators for the Styles section, shared by Selenium and the HTTP fast path
+STYLES_LOCATOR = (By.ID, "styles")
+STYLES_CSS = f"#{STYLES_LOCATOR[1]}"
+TAB_LOCATOR = (By.CSS_SELECTOR, "button[role='tab'], button[aria-selected]")
+CARD_LOCATOR = (By.CSS_SELECTOR, "a[title][href*='/']")
+PAGE_CARD_LOCATOR = (By.CSS_SELECTOR, f"{STYLES_CSS} {CARD_LOCATOR[1]}")
+
+# Same cards for lxml, skipping those inside hidden tab panels
+CARD_XPATH = (
+    ".//a[@title and contains(@href, '/')]"
+    "[not(ancestor-or-self::*[@hidden or @aria-hidden='true'])]"
+)
+
+# Text lines of every style card under a root element (null root -> no cards).
+# innerText follows the rendered layout: inline markup stays on one line and
+# CSS-hidden text (e.g. screen-reader-only spans) is left out.
+CARD_LINES_JS = f"""
+    (root) => root ? Array.from(root.querySelectorAll({json.dumps(CARD_LOCATOR[1])})).map(
+        card => card.innerText.split("\\n")
+            .map(t => t.replace(/\\s+/g, " ").trim())
+            .filter(Boolean)
+    ) : []
+"""
+
+# Card lines of the whole Styles section on the current page
+PAGE_CARD_LINES_FN = f"""
+    () => ({CARD_LINES_JS})(document.getElementById({json.dumps(STYLES_LOCATOR[1])}))
+"""
+
+# Elements that start a new rendered line, used when no browser is available
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5",
+    "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section",
+    "table", "tbody", "tfoot", "thead", "tr", "ul",
+}
+NON_TEXT_TAGS = {"script", "style", "template", "noscript"}
+HIDDEN_CLASSES = {"sr-only", "visually-hidden", "visuallyhidden", "screen-reader-only"}
+
+# Tab and card lookups below start from the document every time, because a
+# tab click may replace the whole Styles section (and every handle inside it).
+# They are JS function expressions shared with the Playwright crawler.
+STYLE_TABS_JS = f"""
+    (document.getElementById({json.dumps(STYLES_LOCATOR[1])})
+        ?.querySelectorAll({json.dumps(TAB_LOCATOR[1])}) ?? [])
+"""
+
+# Click the idx-th tab; returns its label, or null if the tab is gone
+CLICK_TAB_FN = f"""
+    (idx) => {{
+        const tab = {STYLE_TABS_JS}[idx];
+        if (!tab) return null;
+        const label = tab.innerText.trim();
+        tab.click();
+        return label;
+    }}
+"""
+
+# Link of the first style card, used to detect when a tab has re-rendered
+FIRST_CARD_HREF_FN = f"""
+    () => {{
+        const card = document.querySelector({json.dumps(PAGE_CARD_LOCATOR[1])});
+        return card ? card.href : null;
+    }}
+"""
+
+# Done once the first card's link changes or the idx-th tab is selected
+TAB_LOADED_FN = f"""
+    ([previous, idx]) => {{
+        const card = document.querySelector({json.dumps(PAGE_CARD_LOCATOR[1])});
+        const tab = {STYLE_TABS_JS}[idx];
+        return (card !== null && card.href !== previous)
+            || (tab !== undefined && tab.getAttribute("aria-selected") === "true");
+    }}
+"""
+
 def get_style_tabs(styles_section):
     """
-    Retrieve all style category tabs (e.g., Sedan, Coupe, Wagon).
+    Retrieve the indices of all style category tabs (e.g., Sedan, Coupe, Wagon).
 
     Why:
     - Some pages contain tabs, others do not
     - Returning [None] allows unified handling downstream
+    - Indices rather than elements: a tab click may re-render the section,
+      so each tab is looked up again right before it is clicked
     """
-    tabs = styles_section.find_elements(
-        By.XPATH,
-        ".//button[@role='tab' or @aria-selected]"
-    )
-    return tabs if tabs else [None]
+    tabs = styles_section.find_elements(*TAB_LOCATOR)
+    return list(range(len(tabs))) if tabs else [None]
 
-def activate_tab(driver, wait, styles_section, tab, idx):
+def activate_tab(driver, wait, idx):
     """
-    Click a style category tab and wait for the content to update.
+    Click the idx-th style category tab and wait for the content to update.
 
     Why:
     - KBB dynamically updates the DOM
-    - We compare innerHTML before and after clicking to detect real changes
+    - The tab is looked up, read and clicked in a single script, so no
+      element handle can go stale between those steps
+    - The tab is done once it reports aria-selected="true", or once the
+      first style card's link changes (cheaper than diffing innerHTML;
+      also covers tabs that never update aria-selected)
     """
-    if tab is None:
+    if idx is None:
         return None  # no category concept
 
-    category = tab.text.strip() or f"category_{idx}"
-    print(f"➡️ Clicking tab: {category}")
+    previous_href = driver.execute_script(f"return ({FIRST_CARD_HREF_FN})();")
+    label = driver.execute_script(f"return ({CLICK_TAB_FN})(arguments[0]);", idx)
 
-    previous_html = styles_section.get_attribute("innerHTML")
-    driver.execute_script("arguments[0].click();", tab)
+    category = label or f"category_{idx}"
+    print(f"➡️ Clicking tab: {category}")
 
     wait.until(
-        lambda d: d.find_element(By.ID, "styles")
-        .get_attribute("innerHTML") != previous_html
+        lambda d: d.execute_script(
+            f"return ({TAB_LOADED_FN})(arguments[0]);", [previous_href, idx]
+        )
     )
 
     wait.until(
-        EC.presence_of_element_located(
-            (By.XPATH, "//div[@id='styles']//a[@title]")
-        )
+        EC.presence_of_element_located(PAGE_CARD_LOCATOR)
     )
 
     return category
 
 def get_style_cards(driver):
     """
-    Retrieve all style cards currently visible in the Styles section.
+    Retrieve the text lines of every style card currently visible
+    in the Styles section.
+
+    Why:
+    - Querying cards through Selenium costs WebDriver round-trips per card
+    - A single execute_script reads every card's innerText in the browser,
+      which splits lines exactly where the page renders them
+    - #styles is looked up inside the script, so a section re-rendered by
+      a tab click cannot go stale
+    """
+    return driver.execute_script(
+        f"return ({PAGE_CARD_LINES_FN})();"
+    )
+
+def card_text_lines(card):
+    """
+    Split a style card element (lxml) into its rendered text lines.
+
+    Approximates innerText for static HTML:
+    - New lines only at block-level elements and <br>
+    - Hidden elements (hidden attribute, display:none, visibility:hidden,
+      screen-reader-only classes) are skipped
+    """
+    lines = [""]
+
+    def new_line():
+        if lines[-1].strip():
+            lines.append("")
+
+    def walk(el):
+        if el.tag in NON_TEXT_TAGS or is_hidden(el):
+            return
+        if el.tag == "br":
+            new_line()
+            return
+
+        is_block = el.tag in BLOCK_TAGS
+        if is_block:
+            new_line()
+
+        lines[-1] += el.text or ""
+        for child in el:
+            if isinstance(child.tag, str):  # skip comments
+                walk(child)
+            lines[-1] += child.tail or ""
+
+        if is_block:
+            new_line()
+
+    walk(card)
+    return [" ".join(line.split()) for line in lines if line.strip()]
+
+def is_hidden(el):
+    """
+    Whether an lxml element is not rendered (and has no innerText).
     """
-    styles_section = driver.find_element(By.ID, "styles")
-    return styles_section.find_elements(
-        By.XPATH,
-        ".//a[@title and contains(@href, '/')]"
+    style = (el.get("style") or "").replace(" ", "").lower()
+    classes = set((el.get("class") or "").split())
+    return (
+        el.get("hidden") is not None
+        or "display:none" in style
+        or "visibility:hidden" in style
+        or bool(classes & HIDDEN_CLASSES)
     )
 
 # Page loading & navigation helpers
-def load_styles_section(driver, wait, url):
+def kbb_url(brand, model, yr):
+    """
+    Build the KBB page URL for a car model and year.
+    """
+    return f"https://www.kbb.com/{brand}/{model}/{yr}/"
+
+def load_styles_section(driver, wait, url, in_page=False):
     """
     Load the Styles section on a Kelley Blue Book (KBB) car page.
 
+    in_page:
+    - False: navigate with driver.get()
+    - True: the driver already shows a KBB page, so navigate from inside
+      it via location.href, skipping WebDriver navigation bookkeeping.
+      If that navigation never commits (slow server, error page,
+      beforeunload handler), fall back to driver.get() so a navigation
+      problem is not mistaken for a missing page
+
     NOTE:
     - Some model-year combinations do not exist on KBB
       (e.g. Audi RS3 2015).
@@ -225,64 +414,85 @@ def load_styles_section(driver, wait, url):
       will never appear and this function will timeout.
     """
 
-    driver.get(url)
+    if in_page:
+        # Keep a handle on the old document so we do not match its #styles
+        old_root = driver.execute_script(
+            "const root = document.documentElement;"
+            "window.stop(); location.href = arguments[0];"
+            "return root;",
+            url
+        )
+        try:
+            wait.until(EC.staleness_of(old_root))
+        except TimeoutException:
+            print(f"↩️ In-page navigation stalled, reloading: {url}")
+            driver.get(url)
+    else:
+        driver.get(url)
 
     return wait.until(
-        EC.presence_of_element_located((By.ID, "styles"))
+        EC.presence_of_element_located(STYLES_LOCATOR)
     )
 
 
 # Data extraction helpers
-def parse_style_card(card):
+def parse_style_cards(cards):
     """
-    Parse a single style card into a structured dictionary.
+    Parse the text lines of many style cards into a DataFrame at once.
 
-    Returns:
-    - Dictionary of extracted attributes
-    - None if the card does not contain enough information
+    Why:
+    - Cards are padded into a table of text lines and parsed with
+      vectorized pandas/NumPy operations instead of a Python loop per card
+    - Cards with fewer than 6 lines do not contain enough information
+      and are dropped
+    - Values are stored as PyArrow-backed strings (contiguous buffers
+      instead of one Python object per cell)
     """
-    texts = card.text.split("\n")
-    if len(texts) < 6:
-        return None
-
-    cargo_cu_ft, torque_lb_ft = extract_cargo_and_torque(texts)
-
-    return {
-        "Style": safe_get(texts, 0),
-        "Price": safe_get(texts, 1),
-        "MPG": safe_get(texts, 2),
-        "Horsepower": safe_get(texts, 3),
-        "Engine": safe_get(texts, 4),
+    parts = pd.DataFrame(cards).fillna("")
+    lengths = (parts != "").sum(axis=1).to_numpy()
+
+    keep = lengths >= 6
+    parts = parts[keep].reset_index(drop=True)
+    lengths = lengths[keep]
+    if parts.empty:
+        return pd.DataFrame()
+
+    lines = parts.to_numpy(dtype=object)
+    rows = np.arange(len(lines))
+    cargo_cu_ft, torque_lb_ft = extract_cargo_and_torque(parts)
+
+    return pd.DataFrame({
+        "Style": parts[0],
+        "Price": parts[1],
+        "MPG": parts[2],
+        "Horsepower": parts[3],
+        "Engine": parts[4],
         "CargoRoom_cu_ft": cargo_cu_ft,
         "Torque_lb_ft": torque_lb_ft,
-        "0-60": safe_get(texts, -4),
-        "Top Speed": safe_get(texts, -3),
-        "Curb Weight": safe_get(texts, -2),
-    }
+        "0-60": lines[rows, lengths - 4],
+        "Top Speed": lines[rows, lengths - 3],
+        "Curb Weight": lines[rows, lengths - 2],
+    }, dtype=STRING_DTYPE)
 
-def extract_cargo_and_torque(texts):
-    """
-    Extract cargo volume and torque values from style text lines.
+def extract_cargo_and_torque(parts):
     """
-    cargo_cu_ft = None
-    torque_lb_ft = None
+    Extract cargo volume and torque values from a table of style text lines.
 
-    for t in texts:
-        t = t.strip()
-        if "cu ft" in t.lower():
-            cargo_cu_ft = t
-        elif "lb-ft" in t.lower():
-            torque_lb_ft = t
+    Returns the first matching line per card, or "NA" when none matches.
+    """
+    is_cargo = parts.apply(lambda col: col.str.contains("cu ft", case=False, regex=False))
+    is_torque = parts.apply(lambda col: col.str.contains("lb-ft", case=False, regex=False)) & ~is_cargo
 
-    return cargo_cu_ft or "NA", torque_lb_ft or "NA"
+    return first_match(parts, is_cargo), first_match(parts, is_torque)
 
-def safe_get(arr, idx):
+def first_match(parts, mask):
     """
-    Safely access an index in a list.
-
-    Prevents IndexError when cards have missing fields.
+    Pick, for each row, the first cell where mask is True ("NA" if none).
     """
-    return arr[idx] if idx < len(arr) else None
+    hits = mask.to_numpy()
+    first = hits.argmax(axis=1)
+    values = parts.to_numpy(dtype=object)[np.arange(len(parts)), first]
+    return pd.Series(np.where(hits.any(axis=1), values, "NA"), index=parts.index)
 
 def infer_category_from_style(style_name):
     """
@@ -294,18 +504,21 @@ def infer_category_from_style(style_name):
     return None
 
 # Main scraping logic
-def scrape_kbb_styles(driver, wait, url):
+def scrape_kbb_styles(driver, wait, url, in_page=False):
     """
     Scrape all style variants for a given car model and year.
 
+    in_page is forwarded to load_styles_section.
+
     Returns:
     - Pandas DataFrame containing style-level data
+    - None if the page does not exist
     """
-    data = []
+    cards = []
 
     try:
         # Attempt to load the Styles section
-        styles_section = load_styles_section(driver, wait, url)
+        styles_section = load_styles_section(driver, wait, url, in_page)
 
     except TimeoutException:
         # Most common reason for timeout:
@@ -313,59 +526,337 @@ def scrape_kbb_styles(driver, wait, url):
         # - Example: Audi RS3 2015
         # This is expected behavior and should be skipped.
         print(f"⏭️ Skipping unavailable model-year page: {url}")
-        return pd.DataFrame(data)  # or return empty DataFrame if your pipeline expects it
+        return None
 
     print(f"Visiting: {url}")
 
-    styles_section = load_styles_section(driver, wait, url)
     tabs = get_style_tabs(styles_section)
 
-    for idx, tab in enumerate(tabs):
-        category = activate_tab(driver, wait, styles_section, tab, idx)
+    for idx in tabs:
+        category = activate_tab(driver, wait, idx)
 
         style_cards = get_style_cards(driver)
-
-        for card in style_cards:
-            row = parse_style_card(card)
-            if row:
-                data.append(row)
+        cards.extend(style_cards)
 
     print(f"🛞 Found {len(style_cards)} styles.")
-    return pd.DataFrame(data)
+    return parse_style_cards(cards)
 
-def kbb_worker():
+# Plain HTTP helpers
+def fetch_styles_http(client, url):
     """
-    Orchestrates scraping across brands, models, and years.
+    Fetch a car page without a browser and read its style cards.
+
+    Returns a (status_code, has_styles, cards) tuple:
+    - status_code is None when the request itself failed
+    - has_styles tells whether #styles is in the server-rendered HTML
+    - cards is the list of card text lines, or None when the page needs
+      a real browser (no #styles in the HTML, category tabs that must be
+      clicked, or a non-200 response)
+    """
+    try:
+        response = client.get(url)
+    except httpx.HTTPError:
+        return None, False, None
 
-    Returns:
-    - Combined DataFrame of all scraped vehicles
+    if response.status_code != 200:
+        return response.status_code, False, None
+
+    styles = LexborHTMLParser(response.text).css_first(STYLES_CSS)
+    if styles is None:
+        return response.status_code, False, None
+
+    # Tab contents are only rendered after a click
+    if styles.css_first(TAB_LOCATOR[1]) is not None:
+        return response.status_code, True, None
+
+    # Same layout-aware line splitting as the browser's innerText
+    section = lxml.html.fromstring(styles.html)
+    cards = [card_text_lines(card) for card in section.xpath(CARD_XPATH)]
+    return response.status_code, True, cards or None
+
+def head_status(client, url):
+    """
+    Status code of a HEAD request (None if the request failed).
     """
-    all_data = []
+    try:
+        return client.head(url).status_code
+    except httpx.HTTPError:
+        return None
+
+def http_client():
+    """
+    Create the HTTP client shared by all worker threads.
+    """
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS),
+        headers={"User-Agent": USER_AGENT},
+        follow_redirects=True,
+        timeout=HTTP_TIMEOUT,
+    )
+
+# Known-missing pages
+def load_known_missing(path=KNOWN_MISSING_PATH):
+    """
+    Load the set of URLs known not to exist on KBB.
+    """
+    if not os.path.exists(path):
+        return set()
 
+    with open(path, "r") as f:
+        return set(json.load(f))
+
+def save_known_missing(missing, path=KNOWN_MISSING_PATH):
+    """
+    Persist the set of URLs known not to exist on KBB.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(sorted(missing), f, indent=2)
+
+# Browser pool helpers
+def create_pooled_driver():
+    """
+    Start a Chrome driver and bundle it with its own wait and a use counter.
+    """
     driver = scd()
-    wait = WebDriverWait(driver, 15)
+    return {
+        "driver": driver,
+        "wait": WebDriverWait(
+            driver,
+            WAIT_TIMEOUT,
+            poll_frequency=POLL_FREQUENCY,
+            # Tab clicks may re-render #styles; keep polling instead of failing
+            ignored_exceptions=(StaleElementReferenceException,),
+        ),
+        "uses": 0,
+    }
+
+def quit_pooled_driver(entry):
+    """
+    Quit a pooled driver, ignoring errors from an already-dead browser.
+    """
+    try:
+        entry["driver"].quit()
+    except Exception:
+        pass
+
+def driver_rss_mb(driver):
+    """
+    Total resident memory (MB) of chromedriver and the Chrome processes it spawned.
+    """
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+    except (AttributeError, psutil.Error):
+        return 0.0
+
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:
+            pass  # process exited while we were measuring
+
+    return total / (1024 ** 2)
+
+def scrape_with_pool(pool, url):
+    """
+    Borrow a driver from the pool, scrape one URL and hand the driver back.
+
+    NOTE:
+    - A borrowed driver is used by one thread only, so its own WebDriver
+      HTTP connection pool (a single keep-alive connection) is never
+      contended; no larger urllib3 pool is needed
+
+    Why:
+    - Chrome slowly leaks memory over long runs
+    - Drivers are quit and restarted after MAX_USES_PER_INSTANCE pages,
+      or earlier once their processes use more than MAX_RSS_MB_PER_INSTANCE
+    - Pool slots start empty (None) and get a driver on first use, so a
+      driver that fails to start never leaves others running unowned
+    - An error on one page must not abort the whole run: it is logged,
+      the possibly broken driver is replaced, and an empty DataFrame is
+      returned (the page is not recorded as missing, so it is retried on
+      the next run)
 
+    Returns:
+    - Same as scrape_kbb_styles, or an empty DataFrame on error
+    """
+    entry = pool.get()
     try:
-        for brand, models in CARS.items():
-            for model in models:
-                for yr in YEARS:
-                    url = f"https://www.kbb.com/{brand}/{model}/{yr}/"
+        if entry is not None and (
+            entry["uses"] >= MAX_USES_PER_INSTANCE
+            or driver_rss_mb(entry["driver"]) > MAX_RSS_MB_PER_INSTANCE
+        ):
+            print(f"♻️ Recycling driver after {entry['uses']} pages.")
+            quit_pooled_driver(entry)
+            entry = None
+
+        if entry is None:
+            entry = create_pooled_driver()
+
+        # A driver that has served a page before can navigate in-page
+        in_page = entry["uses"] > 0
+        entry["uses"] += 1
+        return scrape_kbb_styles(entry["driver"], entry["wait"], url, in_page)
+    except Exception as e:
+        print(f"❌ Failed to scrape {url}: {type(e).__name__}: {e}")
+        if entry is not None:
+            quit_pooled_driver(entry)
+            entry = None
+        return pd.DataFrame()
+    finally:
+        pool.put(entry)
+
+def scrape_page(client, pool, url, no_http_get, no_http):
+    """
+    Scrape one car page, without a browser when possible.
 
-                    df = scrape_kbb_styles(driver, wait, url)
+    no_http_get / no_http are threading.Events shared by the whole run:
+    - no_http_get is set once a page shows that #styles is not in the
+      server-rendered HTML; later pages only send a cheap HEAD to detect
+      404s before going to Chrome
+    - no_http is set once KBB does not answer plain HTTP at all (timeout
+      or connection error); later pages go straight to Chrome
 
-                    if not df.empty:
-                        df["Brand"] = brand.capitalize()
-                        df["Model"] = model.capitalize()
-                        df["Year"] = yr
-                        all_data.append(df)
+    Returns:
+    - None if the page does not exist (HTTP 404 or no Styles section)
+    - Otherwise a DataFrame of its styles (empty on errors: a failure on
+      the HTTP path is handled here, Chrome failures in scrape_with_pool)
+    """
+    try:
+        status, has_styles, cards = None, False, None
+
+        if no_http.is_set():
+            pass
+        elif no_http_get.is_set():
+            status = head_status(client, url)
+        else:
+            status, has_styles, cards = fetch_styles_http(client, url)
+            if status == 200 and not has_styles:
+                print("🌐 Styles are rendered client-side; using Chrome from now on.")
+                no_http_get.set()
+
+        if status is None and not no_http.is_set():
+            print("🌐 KBB did not answer plain HTTP; skipping it from now on.")
+            no_http.set()
+
+        if status == 404:
+            print(f"⏭️ Skipping unavailable model-year page: {url}")
+            return None
+
+        if cards is not None:
+            print(f"🌐 Fetched without a browser: {url}")
+            return parse_style_cards(cards)
+    except Exception as e:
+        print(f"❌ Failed to scrape {url}: {type(e).__name__}: {e}")
+        return pd.DataFrame()
+
+    return scrape_with_pool(pool, url)
+
+def write_next_page(in_flight, missing, csv_path, header):
+    """
+    Wait for the oldest in-flight page and append its rows to csv_path.
+
+    Returns:
+    - Number of rows written
+    """
+    (brand, model, yr), future = in_flight.popleft()
+    df = future.result()
+
+    if df is None:
+        missing.add(kbb_url(brand, model, yr))
+        return 0
+
+    if df.empty:
+        return 0
+
+    df["Brand"] = brand.capitalize()
+    df["Model"] = model.capitalize()
+    df["Year"] = yr
+
+    df.to_csv(csv_path, mode="w" if header else "a", header=header, index=False)
+    return len(df)
+
+def kbb_worker(csv_path=CSV_PATH):
+    """
+    Orchestrates scraping across brands, models, and years.
+
+    Pages recorded in KNOWN_MISSING_PATH are skipped outright. Each other
+    page is fetched over plain HTTP first: a 404 is recorded as missing
+    and server-rendered pages are parsed directly. Only the remaining
+    pages borrow one of POOL_SIZE Chrome instances; the work is dominated
+    by network and render latency.
+
+    Pages are submitted through a sliding window of MAX_PAGES_IN_FLIGHT
+    and written in brand/model/year order as soon as the oldest one is
+    done, so memory is bounded by the window, not by the number of pages.
+    Rows go to a temporary file that replaces csv_path only when the run
+    finishes with data; a failed run leaves the previous CSV untouched.
+
+    Returns:
+    - Number of rows written to csv_path
+    """
+    missing = load_known_missing()
+
+    grid = [
+        (brand, model, yr)
+        for brand, models in CARS.items()
+        for model in models
+        for yr in YEARS
+    ]
+    urls = [car for car in grid if kbb_url(*car) not in missing]
+    print(f"⏭️ Skipping {len(grid) - len(urls)} known-missing pages.")
+
+    pool = queue.Queue()
+    for _ in range(POOL_SIZE):
+        pool.put(None)  # drivers start on first use
+
+    # Run-wide switches for the plain HTTP path (see scrape_page)
+    no_http_get = threading.Event()
+    no_http = threading.Event()
+
+    tmp_path = f"{csv_path}.tmp"
+    in_flight = deque()
+    rows_written = 0
+
+    try:
+        with http_client() as client, ThreadPoolExecutor(max_workers=HTTP_MAX_CONNECTIONS) as executor:
+            try:
+                for car in urls:
+                    in_flight.append((car, executor.submit(
+                        scrape_page, client, pool, kbb_url(*car), no_http_get, no_http
+                    )))
+
+                    if len(in_flight) >= MAX_PAGES_IN_FLIGHT:
+                        rows_written += write_next_page(in_flight, missing, tmp_path, rows_written == 0)
+
+                while in_flight:
+                    rows_written += write_next_page(in_flight, missing, tmp_path, rows_written == 0)
+            except BaseException:
+                # Do not keep scraping queued pages whose results are discarded
+                executor.shutdown(cancel_futures=True)
+                raise
+
+        if rows_written:
+            os.replace(tmp_path, csv_path)
 
     finally:
-        driver.quit()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+        while not pool.empty():
+            entry = pool.get_nowait()
+            if entry is not None:
+                quit_pooled_driver(entry)
+
+        save_known_missing(missing)
 
-    return pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
+    return rows_written
     
 
 if __name__ == "__main__":
-    df = kbb_worker()
-    print(df)
+    rows = kbb_worker()
+    print(f"{rows} rows written to {CSV_PATH}")
     
\ No newline at end of file
@@ -0,0 +1,177 @@
+"""
+Module: kbb_async.py
+
+Description:
+------------
+Asynchronous variant of the Kelley Blue Book (KBB) crawler built on
+Playwright. Playwright drives Chromium over CDP directly, so there is
+no WebDriver JSON-over-HTTP round-trip per action, and many pages can
+be in flight at once on a single browser.
+
+Responsibilities:
+-----------------
+- Load KBB vehicle pages concurrently
+- Navigate style categories (tabs)
+- Skip and record missing pages in the same KNOWN_MISSING_PATH file
+  as app.scrapper.kbb.kbb_worker
+- Return all rows as one DataFrame (kbb_worker streams them to a CSV
+  and returns the row count instead)
+
+Non-Responsibilities:
+--------------------
+- Parsing rules (shared with app.scrapper.kbb)
+- Persistence of scraped rows (database / files)
+"""
+
+import asyncio
+
+import pandas as pd
+from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from app.core.driver import USER_AGENT, NAVIGATOR_PATCH_JS
+from app.scrapper.kbb import CARS, YEARS, POOL_SIZE, WAIT_TIMEOUT, kbb_url, parse_style_cards
+from app.scrapper.kbb import load_known_missing, save_known_missing
+# Selectors and scripts come from app.scrapper.kbb so both crawlers match
+from app.scrapper.kbb import STYLES_CSS, TAB_LOCATOR
+from app.scrapper.kbb import PAGE_CARD_LINES_FN, CLICK_TAB_FN, FIRST_CARD_HREF_FN, TAB_LOADED_FN
+
+# Resource types the scraper never reads
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+
+async def new_context(browser):
+    """
+    Create a browser context with the same fingerprint and resource
+    blocking as the Selenium driver.
+    """
+    context = await browser.new_context(
+        user_agent=USER_AGENT,
+        viewport={"width": 1920, "height": 1080},
+    )
+    await context.add_init_script(NAVIGATOR_PATCH_JS)
+    await context.route(
+        "**/*",
+        lambda route: route.abort()
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES
+        else route.continue_()
+    )
+    return context
+
+async def activate_tab(page, idx):
+    """
+    Click the idx-th style category tab and wait for the cards to change.
+
+    Why:
+    - Same scripts as the Selenium crawler: the tab is looked up again by
+      index (a click may re-render the section), and it is done once the
+      first card's link changes or the tab reports aria-selected="true"
+    """
+    previous_href = await page.evaluate(FIRST_CARD_HREF_FN)
+    label = await page.evaluate(CLICK_TAB_FN, idx)
+
+    category = label or f"category_{idx}"
+    print(f"➡️ Clicking tab: {category}")
+
+    await page.wait_for_function(
+        TAB_LOADED_FN, arg=[previous_href, idx], timeout=WAIT_TIMEOUT * 1000
+    )
+    return category
+
+async def scrape_one(context, semaphore, url):
+    """
+    Scrape all style variants for a given car model and year.
+
+    An error on one page (a tab that never loads, a navigation failure,
+    a crashed page) is logged and yields an empty DataFrame, so
+    asyncio.gather does not cancel every other page.
+
+    Returns:
+    - None if the page does not exist (no Styles section)
+    - Otherwise a DataFrame of its styles (empty on errors)
+    """
+    async with semaphore:
+        page = await context.new_page()
+        try:
+            try:
+                await page.goto(url, wait_until="domcontentloaded")
+                styles = await page.wait_for_selector(
+                    STYLES_CSS, state="attached", timeout=WAIT_TIMEOUT * 1000
+                )
+            except PlaywrightTimeoutError:
+                # Most likely the model-year page does not exist on KBB
+                print(f"⏭️ Skipping unavailable model-year page: {url}")
+                return None
+
+            print(f"Visiting: {url}")
+
+            # Indices only: each tab is looked up again right before its click
+            tab_count = len(await styles.query_selector_all(TAB_LOCATOR[1]))
+
+            cards = []
+            for idx in range(tab_count) or [None]:
+                if idx is not None:
+                    await activate_tab(page, idx)
+                cards.extend(await page.evaluate(PAGE_CARD_LINES_FN))
+
+            print(f"🛞 Found {len(cards)} styles.")
+            return parse_style_cards(cards)
+        except Exception as e:
+            print(f"❌ Failed to scrape {url}: {type(e).__name__}: {e}")
+            return pd.DataFrame()
+        finally:
+            await page.close()
+
+async def kbb_worker_async():
+    """
+    Orchestrates concurrent scraping across brands, models, and years.
+
+    POOL_SIZE browser contexts share one Chromium process and at most
+    POOL_SIZE pages are open at any time. Pages in KNOWN_MISSING_PATH
+    are skipped, and newly missing ones are added to it.
+
+    Returns:
+    - Combined DataFrame of all scraped vehicles
+    """
+    missing = load_known_missing()
+
+    grid = [
+        (brand, model, yr)
+        for brand, models in CARS.items()
+        for model in models
+        for yr in YEARS
+    ]
+    urls = [car for car in grid if kbb_url(*car) not in missing]
+    print(f"⏭️ Skipping {len(grid) - len(urls)} known-missing pages.")
+    all_data = []
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            contexts = [await new_context(browser) for _ in range(POOL_SIZE)]
+            semaphore = asyncio.Semaphore(POOL_SIZE)
+
+            results = await asyncio.gather(*(
+                scrape_one(contexts[i % POOL_SIZE], semaphore, kbb_url(*car))
+                for i, car in enumerate(urls)
+            ))
+        finally:
+            await browser.close()
+
+    for (brand, model, yr), df in zip(urls, results):
+        if df is None:
+            missing.add(kbb_url(brand, model, yr))
+        elif not df.empty:
+            df["Brand"] = brand.capitalize()
+            df["Model"] = model.capitalize()
+            df["Year"] = yr
+            all_data.append(df)
+
+    save_known_missing(missing)
+
+    return pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
+
+
+if __name__ == "__main__":
+    df = asyncio.run(kbb_worker_async())
+    print(df)
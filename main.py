@@ -13,22 +13,22 @@ if __name__ == "__main__":
     start_time = time.time()
     print_ram_usage("Start")
 
-    df = kbb_worker()
     # Win
-    # print_ram_usage("After scraping")
     # os.makedirs("Car-Recommendation-System/data/raw", exist_ok=True)
 
     # Mac
     DATA_DIR = "data/raw"
     os.makedirs(DATA_DIR, exist_ok=True)
 
+    # Rows are streamed to the CSV page by page while scraping
+    # rows = kbb_worker("Car-Recommendation-System/data/raw/car_data.csv") # Win
+    rows = kbb_worker(f"{DATA_DIR}/car_data.csv") # Mac
+    # print_ram_usage("After scraping")
 
-    if df.empty:
+    if rows == 0:
         print("⚠️ No data scraped. CSV not saved.")
     else:
-        # df.to_csv("Car-Recommendation-System/data/raw/car_data.csv", index=False) # Win
-        df.to_csv(f"{DATA_DIR}/car_data.csv", index=False) # Mac
-        print("✅ Data saved to Car-Recommendation-System/data/raw/car_data.csv")
+        print(f"✅ {rows} rows saved to Car-Recommendation-System/data/raw/car_data.csv")
 
     elapsed = time.time() - start_time
     print_ram_usage("After saving CSV")